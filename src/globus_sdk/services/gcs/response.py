@@ -1,10 +1,31 @@
 from __future__ import annotations
 
+import functools
+import operator
 import re
 import typing as t
 
 from globus_sdk.response import GlobusHTTPResponse, IterableResponse
 
+_UNSET = object()
+
+
+# the set of specs in use is small and fixed, so cache the matchers rather than
+# re-validating and rebuilding them for every response
+@functools.lru_cache(maxsize=256)
+def _make_unpacking_match(spec: str) -> t.Callable[[dict[str, t.Any]], bool]:
+    if not re.fullmatch(r"\w+", spec):
+        raise ValueError("Invalid UnpackingGCSResponse specification.")
+
+    # specs never contain "#", so this is equivalent to splitting off the name
+    prefix = spec + "#"
+
+    def match_func(data: dict[str, t.Any]) -> bool:
+        datatype = data.get("DATA_TYPE")
+        return type(datatype) is str and datatype.startswith(prefix)
+
+    return match_func
+
 
 class IterableGCSResponse(IterableResponse):
     """
@@ -37,65 +58,73 @@ class UnpackingGCSResponse(GlobusHTTPResponse):
         callable which does the matching
     """
 
-    def _default_unpacking_match(
-        self, spec: str
-    ) -> t.Callable[[dict[str, t.Any]], bool]:
-        if not re.fullmatch(r"\w+", spec):
-            raise ValueError("Invalid UnpackingGCSResponse specification.")
+    _match_func: t.Callable[[dict[str, t.Any]], bool]
+    # the resolved value of `data`, or _UNSET if unpacking has not happened yet
+    _unpacked: t.Any
 
-        def match_func(data: dict[str, t.Any]) -> bool:
-            if not ("DATA_TYPE" in data and isinstance(data["DATA_TYPE"], str)):
-                return False
-            if "#" not in data["DATA_TYPE"]:
-                return False
-            name, _version = data["DATA_TYPE"].split("#", 1)
-            return name == spec
-
-        return match_func
+    full_data = property(
+        operator.attrgetter("_parsed_json"),
+        doc="""
+        The full, parsed JSON response data.
+        ``None`` if the data cannot be parsed as JSON.
+        """,
+    )
 
     def __init__(
         self,
         response: GlobusHTTPResponse,
         match: str | t.Callable[[dict[str, t.Any]], bool],
-    ):
+    ) -> None:
         super().__init__(response)
 
-        if callable(match):
+        if isinstance(match, str):
+            self._match_func = self._default_unpacking_match(match)
+        elif callable(match):
             self._match_func = match
         else:
-            self._match_func = self._default_unpacking_match(match)
+            raise TypeError(
+                "UnpackingGCSResponse match must be a string or callable, "
+                f"not '{type(match).__name__}'"
+            )
 
-        self._unpacked_data: dict[str, t.Any] | None = None
-        self._did_unpack = False
+        self._unpacked = _UNSET
 
-    @property
-    def full_data(self) -> t.Any:
-        """
-        The full, parsed JSON response data.
-        ``None`` if the data cannot be parsed as JSON.
-        """
-        return self._parsed_json
+    def _default_unpacking_match(
+        self, spec: str
+    ) -> t.Callable[[dict[str, t.Any]], bool]:
+        return _make_unpacking_match(spec)
 
     def _unpack(self) -> dict[str, t.Any] | None:
         """
         Unpack the response from the `"data"` array, returning the first match found.
         If no matches are founds, or the data is the wrong shape, return None.
         """
-        if isinstance(self._parsed_json, dict) and isinstance(
-            self._parsed_json.get("data"), list
-        ):
-            for item in self._parsed_json["data"]:
-                if isinstance(item, dict) and self._match_func(item):
-                    return item
-        return None
+        if not isinstance(self._parsed_json, dict):
+            return None
+        # without a "data" array there is nothing to unpack
+        data_list = self._parsed_json.get("data")
+        if not isinstance(data_list, list):
+            return None
+        match_func = self._match_func
+        return next(
+            (item for item in data_list if isinstance(item, dict) and match_func(item)),
+            None,
+        )
 
     @property
     def data(self) -> t.Any:
         # only do the unpacking operation once, as it may be expensive on large payloads
-        if not self._did_unpack:
-            self._unpacked_data = self._unpack()
-            self._did_unpack = True
-
-        if self._unpacked_data is not None:
-            return self._unpacked_data
-        return self._parsed_json
+        data = self._unpacked
+        if data is _UNSET:
+            unpacked = self._unpack()
+            data = self._parsed_json if unpacked is None else unpacked
+            self._unpacked = data
+        return data
+
+    def __getitem__(self, key: str | int | slice) -> t.Any:
+        # once unpacking has been done, string keys on dict data can be looked up
+        # directly, without going back through `data`
+        data = self._unpacked
+        if isinstance(key, str) and type(data) is dict:
+            return data[key]
+        return super().__getitem__(key)
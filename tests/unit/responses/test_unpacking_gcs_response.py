@@ -32,10 +32,11 @@ def test_unpacking_response_matches_datatype(make_response, datatype):
     assert "x" not in resp_bar
 
 
-def test_unpacking_response_invalid_spec(make_response):
+@pytest.mark.parametrize("spec", ["foo 1.0", "foo#1.0.0", ".*", ".+", "", "foo*"])
+def test_unpacking_response_invalid_spec(make_response, spec):
     base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": "foo#1.0.0"}]})
     with pytest.raises(ValueError):
-        UnpackingGCSResponse(base_resp, "foo 1.0")
+        UnpackingGCSResponse(base_resp, spec)
 
 
 def test_unpacking_response_invalid_datatype(make_response):
@@ -43,3 +44,113 @@ def test_unpacking_response_invalid_datatype(make_response):
     base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": "foo"}]})
     resp = UnpackingGCSResponse(base_resp, "foo")
     assert "x" not in resp
+
+
+@pytest.mark.parametrize("datatype", ["foobar#1.0.0", "xfoo#1.0.0", "foo_1#1.0.0"])
+def test_unpacking_response_does_not_match_datatype_name_prefix(
+    make_response, datatype
+):
+    base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": datatype}]})
+    resp = UnpackingGCSResponse(base_resp, "foo")
+    assert "x" not in resp
+
+
+def test_unpacking_response_ignores_matching_top_level_data(make_response):
+    base_resp = make_response(
+        json_body={
+            "DATA_TYPE": "foo#1.0.0",
+            "x": 1,
+            "data": [{"x": 2, "DATA_TYPE": "foo#1.0.0"}],
+        }
+    )
+    resp = UnpackingGCSResponse(base_resp, "foo")
+    assert resp["x"] == 2
+
+
+def test_unpacking_response_callback_only_sees_array_items(make_response):
+    # the callback relies on keys which only exist on the array items
+    base_resp = make_response(
+        json_body={"data": [{"DATA_TYPE": "foo#1", "kind": "a", "x": 1}]}
+    )
+    resp = UnpackingGCSResponse(base_resp, lambda d: d["kind"] == "a")
+    assert resp["x"] == 1
+
+
+def test_unpacking_response_shares_parsed_data_with_wrapped_response(make_response):
+    base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": "foo#1.0.0"}]})
+    resp = UnpackingGCSResponse(base_resp, "foo")
+    assert resp.full_data is base_resp.data
+    assert resp.data is base_resp.data["data"][0]
+
+
+def test_unpacking_response_item_access(make_response, monkeypatch):
+    base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": "foo#1.0.0"}]})
+    resp = UnpackingGCSResponse(base_resp, "foo")
+    # first access resolves the unpacked data, subsequent ones read it directly
+    assert resp["x"] == 1
+
+    def fail_on_data_access(self):
+        pytest.fail("data was re-read after unpacking")
+
+    monkeypatch.setattr(UnpackingGCSResponse, "data", property(fail_on_data_access))
+    assert resp["x"] == 1
+    with pytest.raises(KeyError):
+        resp["y"]
+
+
+def test_unpacking_response_skips_malformed_items(make_response):
+    base_resp = make_response(
+        json_body={
+            "data": [
+                "foo#1.0.0",
+                {"x": 1},
+                {"x": 2, "DATA_TYPE": None},
+                {"x": 3, "DATA_TYPE": ["foo#1.0.0"]},
+                {"x": 4, "DATA_TYPE": "foo#1.0.0"},
+            ]
+        }
+    )
+    resp = UnpackingGCSResponse(base_resp, "foo")
+    assert resp["x"] == 4
+
+
+def test_unpacking_response_uses_first_match(make_response):
+    base_resp = make_response(
+        json_body={
+            "data": [
+                {"x": 1, "DATA_TYPE": "bar#1.0.0"},
+                {"x": 2, "DATA_TYPE": "foo#1.0.0"},
+                {"x": 3, "DATA_TYPE": "foo#1.0.0"},
+            ]
+        }
+    )
+    assert UnpackingGCSResponse(base_resp, "foo")["x"] == 2
+    assert UnpackingGCSResponse(base_resp, "bar")["x"] == 1
+
+
+def test_unpacking_response_full_data_is_read_only(make_response):
+    base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": "foo#1.0.0"}]})
+    resp = UnpackingGCSResponse(base_resp, "foo")
+    with pytest.raises(AttributeError):
+        resp.full_data = {}
+    assert resp.full_data is base_resp.data
+
+
+def test_unpacking_response_default_match_can_be_overridden(make_response):
+    class CustomResponse(UnpackingGCSResponse):
+        def _default_unpacking_match(self, spec):
+            return lambda d: d.get("kind") == spec
+
+    base_resp = make_response(
+        json_body={
+            "data": [{"x": 1, "DATA_TYPE": "foo#1.0.0"}, {"x": 2, "kind": "foo"}]
+        }
+    )
+    assert CustomResponse(base_resp, "foo")["x"] == 2
+
+
+@pytest.mark.parametrize("match", [None, b"foo", 3])
+def test_unpacking_response_invalid_match_type(make_response, match):
+    base_resp = make_response(json_body={"data": [{"x": 1, "DATA_TYPE": "foo#1.0.0"}]})
+    with pytest.raises(TypeError, match="must be a string or callable"):
+        UnpackingGCSResponse(base_resp, match)